@@ -1,20 +1,37 @@
 import sys
 import os
 import json
+import collections
+import posixpath
+import threading
 from PySide6.QtWidgets import (
     QApplication, QMainWindow, QTextBrowser, QFileDialog, QToolBar,
     QMessageBox, QStatusBar, QInputDialog, QLabel, QScrollArea,
     QStackedWidget, QVBoxLayout, QWidget, QLineEdit, QDialog,
-    QComboBox, QSpinBox, QPushButton, QHBoxLayout, QCheckBox, QToolButton, QMenu
+    QComboBox, QSpinBox, QPushButton, QHBoxLayout, QCheckBox, QToolButton, QMenu,
+    QProgressBar
 )
 from PySide6.QtGui import (
-    QFont, QFontDatabase, QKeySequence, QAction
+    QFont, QFontDatabase, QKeySequence, QAction, QPixmap, QPixmapCache, QTextDocument,
+    QImageReader
+)
+from PySide6.QtCore import (
+    Qt, Signal, QSettings, QObject, QRunnable, QThreadPool, QTimer, QUrl, QByteArray,
+    QBuffer, QIODevice, QSize
 )
-from PySide6.QtCore import Qt, Signal, QSettings
 
 import module
 import render
 
+_QSS_TEMPLATE = """
+    QMainWindow, QTextBrowser, QScrollArea {{ background-color: {bg}; color: {fg}; }}
+    QLabel {{ color: {fg}; }}
+    QToolBar {{ background: {tb_bg}; border: none; spacing: 6px; }}
+    QToolButton::menu-indicator {{ image: none; }}
+"""
+_QSS_LIGHT = _QSS_TEMPLATE.format(bg="#ffffff", fg="#000000", tb_bg="#f2f2f2")
+_QSS_DARK = _QSS_TEMPLATE.format(bg="#202020", fg="#f0f0f0", tb_bg="#f5f5f5")
+
 class PageScrollArea(QScrollArea):
     def __init__(self, parent=None):
         super().__init__(parent)
@@ -35,6 +52,116 @@ class PageScrollArea(QScrollArea):
                 return
         super().wheelEvent(event)
 
+class _FontLoadSignals(QObject):
+    loaded = Signal(object)
+
+class _FontLoadTask(QRunnable):
+    """Reads user font files off the GUI thread."""
+    def __init__(self, paths, signals):
+        super().__init__()
+        self.paths = paths
+        self.signals = signals
+
+    def run(self):
+        for path in self.paths:
+            try:
+                with open(path, "rb") as f:
+                    self.signals.loaded.emit(f.read())
+            except Exception:
+                pass
+
+class _PasswordRequest:
+    """Carries a password prompt across the worker/GUI thread boundary."""
+    def __init__(self):
+        self.event = threading.Event()
+        self.password = None
+
+class _LoadSignals(QObject):
+    finished = Signal(int, str)
+    passwordNeeded = Signal(object)
+
+class _LoadTask(QRunnable):
+    """Opens a PDF/EPUB off the GUI thread."""
+    def __init__(self, renderer, path, ext, serial, signals):
+        super().__init__()
+        self.renderer = renderer
+        self.path = path
+        self.ext = ext
+        self.serial = serial
+        self.signals = signals
+
+    def run(self):
+        try:
+            if self.ext == ".pdf":
+                self.renderer.load_pdf(self.path, self._ask_password)
+            else:
+                self.renderer.load_epub(self.path)
+            self.signals.finished.emit(self.serial, "")
+        except Exception as e:
+            self.signals.finished.emit(self.serial, str(e))
+
+    def _ask_password(self):
+        req = _PasswordRequest()
+        self.signals.passwordNeeded.emit(req)
+        req.event.wait()
+        return req.password
+
+class _PrefetchSignals(QObject):
+    done = Signal(str, int, object)
+
+class _PrefetchTask(QRunnable):
+    """Renders a page (or spread) to a QImage off the GUI thread."""
+    def __init__(self, renderer, index, zoom, orientation, key, serial, signals):
+        super().__init__()
+        self.renderer = renderer
+        self.index = index
+        self.zoom = zoom
+        self.orientation = orientation
+        self.key = key
+        self.serial = serial
+        self.signals = signals
+
+    def run(self):
+        try:
+            if self.orientation == "horizontal":
+                img = self.renderer.get_pdf_spread_image(self.index, self.zoom)
+            else:
+                img = self.renderer.get_pdf_page_image(self.index, self.zoom)
+        except Exception:
+            img = None
+        self.signals.done.emit(self.key, self.serial, img)
+
+class EpubTextBrowser(QTextBrowser):
+    """Serves epub:// resources straight from the in-memory book."""
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.renderer = None
+
+    def loadResource(self, rtype, url):
+        if url.scheme() == "epub" and self.renderer is not None:
+            name = posixpath.normpath(url.path().lstrip("/"))
+            data = self.renderer.epub_items.get(name)
+            if data is not None:
+                if rtype == QTextDocument.ImageResource:
+                    return self._decode_image(data)
+                return QByteArray(data)
+        return super().loadResource(rtype, url)
+
+    def _decode_image(self, data):
+        """Decode at most viewport width; large illustrations are downscaled
+        inside the decoder instead of decoded full-size and scaled later."""
+        buf = QBuffer()
+        buf.setData(QByteArray(data))
+        buf.open(QIODevice.ReadOnly)
+        reader = QImageReader(buf)
+        size = reader.size()
+        target_w = self.viewport().width() - 32
+        if size.isValid() and 0 < target_w < size.width():
+            target_h = max(1, size.height() * target_w // size.width())
+            reader.setScaledSize(QSize(target_w, target_h))
+        img = reader.read()
+        return img if not img.isNull() else QByteArray(data)
+
 class ClickableLabel(QLabel):
     clicked = Signal()
     def mousePressEvent(self, event):
@@ -118,19 +245,25 @@ class ConvertDialog(QDialog):
         self.convert_btn.clicked.connect(self.perform_convert)
         self.cancel_btn.clicked.connect(self.reject)
 
+        self.progress_bar = QProgressBar()
+        self.progress_bar.hide()
+
         layout = QVBoxLayout(self)
         layout.addWidget(QLabel("Mode:"))
         layout.addWidget(self.mode_combo)
         layout.addWidget(self.input_label); layout.addWidget(self.input_btn)
         layout.addWidget(self.output_label); layout.addWidget(self.output_btn)
         layout.addWidget(self.password_check); layout.addWidget(self.password_edit)
-        
+        layout.addWidget(self.progress_bar)
+
         btn_row = QHBoxLayout()
         btn_row.addStretch(1); btn_row.addWidget(self.convert_btn); btn_row.addWidget(self.cancel_btn)
         layout.addLayout(btn_row)
 
         self.input_paths = []
         self.output_path = ""
+        self._worker = None
+        self._rejected = False
 
     def choose_input(self):
         mode = self.mode_combo.currentData()
@@ -157,44 +290,145 @@ class ConvertDialog(QDialog):
         if not self.input_paths or not self.output_path:
             QMessageBox.warning(self, "Error", "Selection incomplete.")
             return
-        
+
         mode = self.mode_combo.currentData()
         pw = self.password_edit.text() if self.password_check.isChecked() else None
-        
+
+        self.convert_btn.setEnabled(False)
+        self.progress_bar.setRange(0, len(self.input_paths))
+        self.progress_bar.setValue(0)
+        self.progress_bar.show()
+
+        self._worker = ConvertWorker(mode, self.input_paths, self.output_path, pw)
+        self._worker.signals.progress.connect(self.progress_bar.setValue)
+        self._worker.signals.finished.connect(self._convert_done)
+        self._worker.signals.error.connect(self._convert_error)
+        QThreadPool.globalInstance().start(self._worker)
+
+    def reject(self):
+        self._rejected = True
+        if self._worker:
+            self._worker.cancel()
+        super().reject()
+
+    def _convert_done(self):
+        if self._rejected:
+            return
+        self.progress_bar.hide()
+        self.convert_btn.setEnabled(True)
+        QMessageBox.information(self, "Success", "Conversion completed.")
+        self.accept()
+
+    def _convert_error(self, message):
+        if self._rejected:
+            return
+        self.progress_bar.hide()
+        self.convert_btn.setEnabled(True)
+        QMessageBox.critical(self, "Error", f"Failed: {message}")
+
+class _ConvertSignals(QObject):
+    progress = Signal(int)
+    finished = Signal()
+    error = Signal(str)
+
+class _ConvertCancelled(Exception):
+    pass
+
+class ConvertWorker(QRunnable):
+    """Runs a conversion off the GUI thread."""
+    def __init__(self, mode, input_paths, output_path, password):
+        super().__init__()
+        self.signals = _ConvertSignals()
+        self.mode = mode
+        self.input_paths = input_paths
+        self.output_path = output_path
+        self.password = password
+        self.cancelled = False
+
+    def cancel(self):
+        self.cancelled = True
+
+    def _report_progress(self, value):
+        # Runs inside the conversion loop; raising aborts it before the
+        # output file is written.
+        if self.cancelled:
+            raise _ConvertCancelled()
+        self.signals.progress.emit(value)
+
+    def run(self):
         try:
-            if mode == "text_pdf":
-                module.ConverterLogic.text_to_pdf(self.input_paths[0], self.output_path, pw)
-            elif mode == "text_epub":
+            if self.mode == "text_pdf":
+                module.ConverterLogic.text_to_pdf(self.input_paths[0], self.output_path, self.password)
+            elif self.mode == "text_epub":
                 module.ConverterLogic.text_to_epub(self.input_paths[0], self.output_path)
-            elif mode == "images_pdf":
-                module.ConverterLogic.images_to_pdf(self.input_paths, self.output_path, pw)
-            
-            QMessageBox.information(self, "Success", "Conversion completed.")
-            self.accept()
+            elif self.mode == "images_pdf":
+                module.ConverterLogic.images_to_pdf(self.input_paths, self.output_path, self.password,
+                                                    progress_callback=self._report_progress)
+            if not self.cancelled:
+                self.signals.finished.emit()
+        except _ConvertCancelled:
+            pass
         except Exception as e:
-            QMessageBox.critical(self, "Error", f"Failed: {e}")
+            if not self.cancelled:
+                self.signals.error.emit(str(e))
 
 class FeReaderWindow(QMainWindow):
     def __init__(self):
         super().__init__()
         
         self.cfg_mgr = module.ConfigManager()
-        self.settings = QSettings("Neofilisoft", "FeReader")
-        
+        self._settings = None
+        self._cfg_cache = {k: self.cfg_mgr.get(k) for k in
+                           ("theme", "font_family", "font_size", "language", "display_mode")}
+        self._cfg_dirty = False
+
         self.renderer = render.RenderEngine()
 
         self.language = self.cfg_mgr.get("language")
+        self._lang_bundle = module.LANG_STRINGS.get(self.language, module.LANG_STRINGS["en"])
         self.theme = self.cfg_mgr.get("theme")
         self.font_family = self.cfg_mgr.get("font_family")
         self.base_font_size = int(self.cfg_mgr.get("font_size"))
 
         self.current_book_title = "Untitled"
         self.current_index = 0
+        self._page_count = 0
+        self._vertical_limit = 0
+        self._horizontal_limit = 0
         self.current_font_size = self.base_font_size
+        self._epub_font = QFont(self.font_family, self.base_font_size)
+        self._epub_font_applied = False
+        self._epub_doc_cache = collections.OrderedDict()
+        self._epub_doc_cache_cap = 8
         self.current_zoom = 1.0
         self.view_mode = "single"
         self.view_orientation = "vertical"
         self._continuous_needs_build = True
+        self._cached_families = None
+        self._applied_theme = None
+
+        self._prefetch_pending = set()
+        self._book_serial = 0
+        self._prefetch_signals = _PrefetchSignals()
+        self._prefetch_signals.done.connect(self._prefetch_done)
+
+        self._load_in_flight = False
+        self._loading_path = None
+        self._loading_title = None
+        self._last_status = None
+        self._last_zoom_text = None
+
+        self._pending_step = 0
+        self._wheel_timer = QTimer(self)
+        self._wheel_timer.setSingleShot(True)
+        self._wheel_timer.setInterval(50)
+        self._wheel_timer.timeout.connect(self._flush_wheel_steps)
+
+        self._zoom_base = None
+        self._zoom_finalize_timer = QTimer(self)
+        self._zoom_finalize_timer.setSingleShot(True)
+        self._zoom_finalize_timer.setInterval(100)
+        self._zoom_finalize_timer.timeout.connect(self._update_view)
 
         self._load_user_fonts()
         self.setWindowTitle(f"FeReader - Version {module.APP_VERSION}")
@@ -202,7 +436,8 @@ class FeReaderWindow(QMainWindow):
 
         # UI Components
         self.stack = QStackedWidget()
-        self.text_view = QTextBrowser()
+        self.text_view = EpubTextBrowser()
+        self.text_view.renderer = self.renderer
         self.text_view.setOpenExternalLinks(True)
         self.text_view.selectionChanged.connect(self._handle_text_selection)
 
@@ -211,8 +446,8 @@ class FeReaderWindow(QMainWindow):
         self.single_scroll = PageScrollArea()
         self.single_scroll.setWidgetResizable(True)
         self.single_scroll.setWidget(self.single_image_label)
-        self.single_scroll.on_scroll_prev = self.go_prev
-        self.single_scroll.on_scroll_next = self.go_next
+        self.single_scroll.on_scroll_prev = self._queue_scroll_prev
+        self.single_scroll.on_scroll_next = self._queue_scroll_next
 
         self.multi_container = QWidget()
         self.multi_layout = QVBoxLayout(self.multi_container)
@@ -221,6 +456,10 @@ class FeReaderWindow(QMainWindow):
         self.multi_scroll = QScrollArea()
         self.multi_scroll.setWidgetResizable(True)
         self.multi_scroll.setWidget(self.multi_container)
+        self.multi_scroll.verticalScrollBar().valueChanged.connect(self._refresh_visible_pages)
+        self._multi_labels = []
+        self._label_pool = []
+        self._page_sizes = []
 
         self.stack.addWidget(self.text_view)
         self.stack.addWidget(self.single_scroll)
@@ -235,47 +474,67 @@ class FeReaderWindow(QMainWindow):
         self.apply_theme()
         self.apply_language()
 
+    @property
+    def settings(self):
+        # QSettings opens a registry/ini-backed store; defer until first use.
+        if self._settings is None:
+            self._settings = QSettings("Neofilisoft", "FeReader")
+        return self._settings
+
     def tr(self, key):
-        bundle = module.LANG_STRINGS.get(self.language, module.LANG_STRINGS["en"])
-        return bundle.get(key, key)
+        return self._lang_bundle.get(key, key)
 
     def closeEvent(self, event):
         self.renderer.cleanup()
+        if self.isFullScreen(): mode = "2"
+        elif self.isMaximized(): mode = "1"
+        else: mode = "0"
+        self._set_cfg("display_mode", mode)
         self.save_settings()
         self.settings.setValue("window/geometry", self.saveGeometry())
         event.accept()
 
+    def _set_cfg(self, key, value):
+        value = str(value)
+        if self._cfg_cache.get(key) != value:
+            self._cfg_cache[key] = value
+            self.cfg_mgr.set(key, value)
+            self._cfg_dirty = True
+
     def save_settings(self):
-        self.cfg_mgr.set("theme", self.theme)
-        self.cfg_mgr.set("font_family", self.font_family)
-        self.cfg_mgr.set("font_size", self.base_font_size)
-        self.cfg_mgr.set("language", self.language)
-        if self.isFullScreen(): mode = "2"
-        elif self.isMaximized(): mode = "1"
-        else: mode = "0"
-        self.cfg_mgr.set("display_mode", mode)
-        self.cfg_mgr.save()
+        self._set_cfg("theme", self.theme)
+        self._set_cfg("font_family", self.font_family)
+        self._set_cfg("font_size", self.base_font_size)
+        self._set_cfg("language", self.language)
+        if self._cfg_dirty:
+            self.cfg_mgr.save()
+            self._cfg_dirty = False
 
     def _load_user_fonts(self):
-        for name in os.listdir(module.APP_DIR):
-            if name.lower().endswith((".ttf", ".otf")):
-                try: QFontDatabase.addApplicationFont(os.path.join(module.APP_DIR, name))
-                except: pass
+        paths = [os.path.join(module.APP_DIR, name) for name in os.listdir(module.APP_DIR)
+                 if name.lower().endswith((".ttf", ".otf"))]
+        if not paths:
+            return
+        self._font_signals = _FontLoadSignals()
+        self._font_signals.loaded.connect(self._register_font_bytes)
+        QThreadPool.globalInstance().start(_FontLoadTask(paths, self._font_signals))
+
+    def _register_font_bytes(self, data):
+        try: QFontDatabase.addApplicationFontFromData(data)
+        except: pass
+        self._cached_families = None
 
     def apply_language(self):
+        self._lang_bundle = module.LANG_STRINGS.get(self.language, module.LANG_STRINGS["en"])
         self.menu_btn.setText(self.tr("menu"))
         self.prev_action.setText(self.tr("prev"))
         self.next_action.setText(self.tr("next"))
     
     def apply_theme(self):
-        bg, fg = ("#202020", "#f0f0f0") if self.theme == "dark" else ("#ffffff", "#000000")
-        tb_bg = "#f5f5f5" if self.theme == "dark" else "#f2f2f2"
-        self.setStyleSheet(f"""
-            QMainWindow, QTextBrowser, QScrollArea {{ background-color: {bg}; color: {fg}; }}
-            QLabel {{ color: {fg}; }}
-            QToolBar {{ background: {tb_bg}; border: none; spacing: 6px; }}
-            QToolButton::menu-indicator {{ image: none; }}
-        """)
+        if self._applied_theme == self.theme:
+            return
+        self.setStyleSheet(_QSS_DARK if self.theme == "dark" else _QSS_LIGHT)
+        self._applied_theme = self.theme
 
     def _create_actions(self):
         self.fullscreen_action = QAction("Fullscreen", self)
@@ -295,28 +554,26 @@ class FeReaderWindow(QMainWindow):
 
         self.menu_btn = QToolButton()
         self.menu_btn.setPopupMode(QToolButton.InstantPopup)
-        
-        self.main_menu = QMenu(self)  
-        self.main_menu.addAction(self.tr("open"), self.open_file, "Ctrl+O")
-        self.main_menu.addAction(self.tr("settings"), self.open_settings_dialog, "F1")
-        self.main_menu.addAction(self.tr("convert"), self.open_convert_dialog, "F2")
-        self.main_menu.addSeparator()
-        self.main_menu.addAction(self.tr("exit"), QApplication.instance().quit, "Alt+F4")
-        
+
+        self.main_menu = QMenu(self)
+        self._main_menu_built = False
+        self.main_menu.aboutToShow.connect(self._build_main_menu)
+
         self.menu_btn.setMenu(self.main_menu)
         self.menu_btn.setText(self.tr("file"))
         tb.addWidget(self.menu_btn)
 
         self.view_btn = QToolButton()
         self.view_btn.setPopupMode(QToolButton.InstantPopup)
-        
-        self.view_menu = QMenu(self) 
-        self.v_act = self.view_menu.addAction(self.tr("vertical"), lambda: self.set_view_orientation("vertical"))
-        self.h_act = self.view_menu.addAction(self.tr("horizontal"), lambda: self.set_view_orientation("horizontal"))
-        self.v_act.setCheckable(True)
-        self.h_act.setCheckable(True)
-        self.v_act.setChecked(True)
-        
+
+        self.view_menu = QMenu(self)
+        self._view_menu_built = False
+        self.view_menu.aboutToShow.connect(self._build_view_menu)
+        self.v_act = None
+        self.h_act = None
+        self.one_act = None
+        self.all_act = None
+
         self.view_btn.setMenu(self.view_menu)
         self.view_btn.setText(self.tr("view"))
         tb.addWidget(self.view_btn)
@@ -333,30 +590,107 @@ class FeReaderWindow(QMainWindow):
         self.zoom_label.clicked.connect(self.zoom_label_clicked)
         tb.addWidget(self.zoom_label)
 
+    def _build_main_menu(self):
+        if self._main_menu_built:
+            return
+        self._main_menu_built = True
+        self.main_menu.addAction(self.tr("open"), self.open_file, "Ctrl+O")
+        self.main_menu.addAction(self.tr("settings"), self.open_settings_dialog, "F1")
+        self.main_menu.addAction(self.tr("convert"), self.open_convert_dialog, "F2")
+        self.main_menu.addSeparator()
+        self.main_menu.addAction(self.tr("exit"), QApplication.instance().quit, "Alt+F4")
+
+    def _build_view_menu(self):
+        if self._view_menu_built:
+            return
+        self._view_menu_built = True
+        self.v_act = self.view_menu.addAction(self.tr("vertical"), self._set_vertical)
+        self.h_act = self.view_menu.addAction(self.tr("horizontal"), self._set_horizontal)
+        self.v_act.setCheckable(True)
+        self.h_act.setCheckable(True)
+        self.v_act.setChecked(self.view_orientation == "vertical")
+        self.h_act.setChecked(self.view_orientation == "horizontal")
+        self.view_menu.addSeparator()
+        self.one_act = self.view_menu.addAction(self.tr("one_page"), self._set_single_mode)
+        self.all_act = self.view_menu.addAction(self.tr("all_pages"), self._set_continuous_mode)
+        self.one_act.setCheckable(True)
+        self.all_act.setCheckable(True)
+        self.one_act.setChecked(self.view_mode == "single")
+        self.all_act.setChecked(self.view_mode == "continuous")
+
     def open_file(self):
+        if self._load_in_flight: return
         path, _ = QFileDialog.getOpenFileName(self, "Open", "", "Files (*.pdf *.epub)")
         if not path: return
-        
-        ext = os.path.splitext(path)[1].lower()
-        try:
-            if ext == ".pdf":
-                self.renderer.load_pdf(path, lambda: QInputDialog.getText(self, "Password", "Enter:", QLineEdit.Password)[0])
-                self.current_zoom = self.renderer.get_initial_zoom(self.single_scroll.width()-25, self.single_scroll.height()-25)
-            elif ext == ".epub":
-                self.renderer.load_epub(path)
-                self.current_font_size = self.base_font_size
-            else:
-                return
 
-            self.current_book_title = os.path.basename(path)
-            self.current_index = 0
-            self.load_highlights()
-            self._update_view()
-        except Exception as e:
-            QMessageBox.critical(self, "Error", str(e))
+        # One pass over the string instead of splitext + basename.
+        dot = path.rfind(".")
+        slash = max(path.rfind("/"), path.rfind("\\"))
+        ext = path[dot:].lower() if dot > slash else ""
+        base = path[slash + 1:]
+        if ext not in (".pdf", ".epub"):
+            return
+
+        self._load_in_flight = True
+        self._loading_path = path
+        self._loading_title = base
+        self._book_serial += 1
+        self.prev_action.setEnabled(False)
+        self.next_action.setEnabled(False)
+        self.statusBar().showMessage(f"Loading {base}...")
+        self._last_status = None
+
+        self._load_signals = _LoadSignals()
+        self._load_signals.finished.connect(self._load_finished)
+        self._load_signals.passwordNeeded.connect(self._provide_password)
+        task = _LoadTask(self.renderer, path, ext, self._book_serial, self._load_signals)
+        QThreadPool.globalInstance().start(task)
+
+    def _provide_password(self, req):
+        req.password = QInputDialog.getText(self, "Password", "Enter:", QLineEdit.Password)[0]
+        req.event.set()
+
+    def _load_finished(self, serial, error):
+        if serial != self._book_serial:
+            return
+        self._load_in_flight = False
+        self.prev_action.setEnabled(True)
+        self.next_action.setEnabled(True)
+        if error:
+            QMessageBox.critical(self, "Error", error)
+            self._update_statusbar()
+            return
+
+        if self.renderer.book_type == "pdf":
+            self.current_zoom = self.renderer.get_initial_zoom(self.single_scroll.width()-25, self.single_scroll.height()-25)
+        else:
+            self.current_font_size = self.base_font_size
+
+        self.current_book_title = self._loading_title
+        self.current_index = 0
+        self._page_count = len(self.renderer.pages)
+        self._drop_epub_doc_cache()
+        self._zoom_base = None
+        # Placeholders from the previous book are sized for its pages.
+        self._continuous_needs_build = True
+        self._page_sizes = []
+        self._vertical_limit = max(0, self._page_count - 1)
+        self._horizontal_limit = self._vertical_limit - (self._vertical_limit % 2)
+        self._prefetch_pending.clear()
+        self.load_highlights()
+        self._update_view()
+
+    def _drop_epub_doc_cache(self):
+        # The documents are parented to the browser, so clear() alone would
+        # keep every laid-out chapter alive for the window's lifetime.
+        current = self.text_view.document()
+        while self._epub_doc_cache:
+            doc = self._epub_doc_cache.popitem(last=False)[1]
+            if doc is not current:
+                doc.deleteLater()
 
     def _update_view(self):
-        if not self.renderer.pages:
+        if not self._page_count:
             self.stack.setCurrentWidget(self.text_view)
             self.text_view.setPlainText("")
             self._update_statusbar()
@@ -364,75 +698,308 @@ class FeReaderWindow(QMainWindow):
 
         if self.renderer.book_type == "epub":
             self.stack.setCurrentWidget(self.text_view)
-            self.text_view.setHtml(self.renderer.pages[self.current_index])
-            self.text_view.setFont(QFont(self.font_family, self.current_font_size))
+            font_dirty = not self._epub_font_applied
+            if self._epub_font.family() != self.font_family:
+                self._epub_font.setFamily(self.font_family)
+                font_dirty = True
+            if self._epub_font.pointSize() != self.current_font_size:
+                self._epub_font.setPointSize(self.current_font_size)
+                font_dirty = True
+            if font_dirty:
+                self.text_view.setFont(self._epub_font)
+                self._epub_font_applied = True
+                # Cached chapters were laid out with the old font.
+                self._drop_epub_doc_cache()
+
+            i = self.current_index
+            doc = self._epub_doc_cache.get(i)
+            if doc is None:
+                name = self.renderer.pages[i]
+                doc = QTextDocument(self.text_view)
+                doc.setDefaultFont(self._epub_font)
+                doc.setBaseUrl(QUrl("epub:///" + name))
+                data = self.renderer.epub_items.get(name, b"")
+                doc.setHtml(data.decode("utf-8", errors="ignore"))
+                self._epub_doc_cache[i] = doc
+                while len(self._epub_doc_cache) > self._epub_doc_cache_cap:
+                    self._epub_doc_cache.popitem(last=False)[1].deleteLater()
+            else:
+                self._epub_doc_cache.move_to_end(i)
+            if self.text_view.document() is not doc:
+                self.text_view.setDocument(doc)
         
+        elif self.renderer.book_type == "pdf" and self.view_mode == "continuous":
+            self.stack.setCurrentWidget(self.multi_scroll)
+            if self._continuous_needs_build:
+                self._build_continuous_pdf_widgets()
+            self._refresh_visible_pages()
+
         elif self.renderer.book_type == "pdf":
             self.stack.setCurrentWidget(self.single_scroll)
-            if self.view_orientation == "horizontal":
-                pix = self.renderer.get_pdf_spread_pixmap(self.current_index, self.current_zoom)
+            key = self._pix_key(self.current_index)
+            cached = QPixmap()
+            if QPixmapCache.find(key, cached):
+                pix = cached
             else:
-                pix = self.renderer.get_pdf_page_pixmap(self.current_index, self.current_zoom)
-            
+                if self.view_orientation == "horizontal":
+                    pix = self.renderer.get_pdf_spread_pixmap(self.current_index, self.current_zoom)
+                else:
+                    pix = self.renderer.get_pdf_page_pixmap(self.current_index, self.current_zoom)
+                if pix:
+                    QPixmapCache.insert(key, pix)
+
             if pix:
+                self._zoom_base = (pix, self.current_zoom)
+                self.single_scroll.setUpdatesEnabled(False)
                 self.single_image_label.setPixmap(pix)
-                self.single_image_label.adjustSize()
-        
+                if self.single_image_label.size() != pix.size():
+                    self.single_image_label.resize(pix.size())
+                self.single_scroll.setUpdatesEnabled(True)
+            self._schedule_prefetch()
+
         self._update_statusbar()
         self._update_zoom_label()
 
+    def _pix_key(self, index):
+        # The book serial prefix invalidates old entries on document change.
+        # Zoom is rounded so float drift from repeated +/-0.1 steps cannot
+        # produce near-identical keys that always miss.
+        return f"{self._book_serial}:{index}:{round(self.current_zoom, 2)}:{self.view_orientation}"
+
+    def _schedule_prefetch(self):
+        if self.renderer.book_type != "pdf":
+            return
+        step = 2 if self.view_orientation == "horizontal" else 1
+        # Warm two flips in each direction, nearest first, but keep at most
+        # two renders in flight so MuPDF isn't thrashed.
+        probe = QPixmap()
+        for delta in (step, -step, 2 * step, -2 * step):
+            if len(self._prefetch_pending) >= 2:
+                break
+            target = self.current_index + delta
+            if not (0 <= target < self._page_count):
+                continue
+            key = self._pix_key(target)
+            if key in self._prefetch_pending or QPixmapCache.find(key, probe):
+                continue
+            self._prefetch_pending.add(key)
+            task = _PrefetchTask(self.renderer, target, self.current_zoom,
+                                 self.view_orientation, key, self._book_serial,
+                                 self._prefetch_signals)
+            QThreadPool.globalInstance().start(task)
+
+    def _prefetch_done(self, key, serial, img):
+        self._prefetch_pending.discard(key)
+        if serial != self._book_serial or img is None:
+            return
+        QPixmapCache.insert(key, QPixmap.fromImage(img))
+
+    def _queue_scroll_prev(self):
+        self._pending_step -= 1
+        self._wheel_timer.start()
+
+    def _queue_scroll_next(self):
+        self._pending_step += 1
+        self._wheel_timer.start()
+
+    def _flush_wheel_steps(self):
+        steps = self._pending_step
+        self._pending_step = 0
+        if not steps or not self._page_count:
+            return
+        horizontal = self.renderer.book_type == "pdf" and self.view_orientation == "horizontal"
+        step = 2 if horizontal else 1
+        limit = self._horizontal_limit if horizontal else self._vertical_limit
+        self.current_index = max(0, min(limit, self.current_index + steps * step))
+        self._update_view()
+
     def go_prev(self):
-        if not self.renderer.pages: return
+        if not self._page_count: return
         step = 2 if (self.renderer.book_type == "pdf" and self.view_orientation == "horizontal") else 1
         self.current_index = max(0, self.current_index - step)
         self._update_view()
 
     def go_next(self):
-        if not self.renderer.pages: return
-        step = 2 if (self.renderer.book_type == "pdf" and self.view_orientation == "horizontal") else 1
-        limit = len(self.renderer.pages) - 1
-        if self.renderer.book_type == "pdf" and self.view_orientation == "horizontal" and limit % 2 != 0:
-             limit -= 1
+        if not self._page_count: return
+        horizontal = self.renderer.book_type == "pdf" and self.view_orientation == "horizontal"
+        step = 2 if horizontal else 1
+        limit = self._horizontal_limit if horizontal else self._vertical_limit
         self.current_index = min(limit, self.current_index + step)
         self._update_view()
 
     def zoom_in(self):
         if self.renderer.book_type == "pdf":
             self.current_zoom = min(5.0, self.current_zoom + 0.1)
+            if self.view_mode == "continuous":
+                self._rescale_continuous()
+            else:
+                self._preview_zoom()
         else:
             self.current_font_size = min(60, self.current_font_size + 2)
-        self._update_view()
+            self._update_zoom_label()
+            self._zoom_finalize_timer.start()
 
     def zoom_out(self):
         if self.renderer.book_type == "pdf":
             self.current_zoom = max(0.1, self.current_zoom - 0.1)
+            if self.view_mode == "continuous":
+                self._rescale_continuous()
+            else:
+                self._preview_zoom()
         else:
             self.current_font_size = max(8, self.current_font_size - 2)
-        self._update_view()
+            self._update_zoom_label()
+            self._zoom_finalize_timer.start()
+
+    def _preview_zoom(self):
+        """Cheap fast-scaled preview during a zoom gesture; the real render
+        happens once the gesture pauses."""
+        if self._zoom_base is None:
+            self._update_view()
+            return
+        pix, base_zoom = self._zoom_base
+        factor = self.current_zoom / base_zoom
+        preview = pix.scaled(pix.size() * factor, Qt.KeepAspectRatio, Qt.FastTransformation)
+        self.single_scroll.setUpdatesEnabled(False)
+        self.single_image_label.setPixmap(preview)
+        self.single_image_label.resize(preview.size())
+        self.single_scroll.setUpdatesEnabled(True)
+        self._update_zoom_label()
+        self._zoom_finalize_timer.start()
 
     def zoom_label_clicked(self):
         val, ok = QInputDialog.getInt(self, "Zoom", "Percent:", int(self.current_zoom*100), 50, 300)
         if ok:
-            if self.renderer.book_type == "pdf": self.current_zoom = val/100.0
-            else: self.current_font_size = int(self.base_font_size * (val/100.0))
+            if self.renderer.book_type == "pdf":
+                self.current_zoom = val/100.0
+                # Placeholders are sized for the old zoom; resize them or the
+                # new renders come out mismatched/clipped.
+                if self.view_mode == "continuous":
+                    self._rescale_continuous()
+                    return
+            else:
+                self.current_font_size = int(self.base_font_size * (val/100.0))
+            self._update_view()
+
+    def _build_continuous_pdf_widgets(self):
+        """Create empty fixed-size placeholders only; pixmaps are rendered
+        on demand as they scroll into view."""
+        self._clear_multi_layout()
+        self._page_sizes = [self.renderer.get_page_size(i) for i in range(self._page_count)]
+        for w, h in self._page_sizes:
+            lbl = self._take_label()
+            lbl.setFixedSize(int(w * self.current_zoom), int(h * self.current_zoom))
+            self.multi_layout.addWidget(lbl)
+            self._multi_labels.append(lbl)
+        self.multi_layout.activate()
+        self._continuous_needs_build = False
+
+    def _take_label(self):
+        if self._label_pool:
+            lbl = self._label_pool.pop()
+            lbl.show()
+            return lbl
+        lbl = QLabel()
+        lbl.setAlignment(Qt.AlignCenter)
+        return lbl
+
+    def _clear_multi_layout(self):
+        # Recycle labels instead of deleteLater: tearing down a long
+        # document queued one deletion event per page.
+        while self.multi_layout.count():
+            item = self.multi_layout.takeAt(0)
+            widget = item.widget()
+            if widget:
+                widget.clear()
+                widget.hide()
+                self._label_pool.append(widget)
+        self._multi_labels = []
+
+    def _refresh_visible_pages(self):
+        if self.renderer.book_type != "pdf" or self.view_mode != "continuous":
+            return
+        if not self._multi_labels:
+            return
+        viewport_h = self.multi_scroll.viewport().height()
+        top = self.multi_scroll.verticalScrollBar().value()
+        bottom = top + viewport_h
+        margin = viewport_h  # keep roughly a screen warm in each direction
+        for i, lbl in enumerate(self._multi_labels):
+            y = lbl.y()
+            if y + lbl.height() >= top - margin and y <= bottom + margin:
+                pm = lbl.pixmap()
+                if pm is None or pm.isNull():
+                    pix = self.renderer.get_pdf_page_pixmap(i, self.current_zoom)
+                    if pix:
+                        lbl.setPixmap(pix)
+            else:
+                pm = lbl.pixmap()
+                if pm is not None and not pm.isNull():
+                    lbl.clear()
+
+    def _rescale_continuous(self):
+        """Resize existing placeholders on zoom instead of rebuilding every
+        widget; only the visible window gets re-rendered."""
+        if not self._multi_labels:
+            self._continuous_needs_build = True
             self._update_view()
+            return
+        self.multi_scroll.setUpdatesEnabled(False)
+        for lbl, (w, h) in zip(self._multi_labels, self._page_sizes):
+            lbl.clear()
+            lbl.setFixedSize(int(w * self.current_zoom), int(h * self.current_zoom))
+        self.multi_layout.activate()
+        self.multi_scroll.setUpdatesEnabled(True)
+        self._update_zoom_label()
+        # Placeholder geometry updates immediately; the expensive visible-page
+        # re-render waits for the gesture to pause.
+        self._zoom_finalize_timer.start()
+
+    def set_view_mode(self, mode):
+        if mode == self.view_mode:
+            return
+        self.view_mode = mode
+        if self.one_act:
+            self.one_act.setChecked(mode == "single")
+            self.all_act.setChecked(mode == "continuous")
+        if mode == "continuous":
+            self._continuous_needs_build = True
+        self._update_view()
+
+    def _set_single_mode(self):
+        self.set_view_mode("single")
+
+    def _set_continuous_mode(self):
+        self.set_view_mode("continuous")
+
+    def _set_vertical(self):
+        self.set_view_orientation("vertical")
+
+    def _set_horizontal(self):
+        self.set_view_orientation("horizontal")
 
     def set_view_orientation(self, mode):
         self.view_orientation = mode
-        self.v_act.setChecked(mode == "vertical")
-        self.h_act.setChecked(mode == "horizontal")
+        if self.v_act:
+            self.v_act.setChecked(mode == "vertical")
+            self.h_act.setChecked(mode == "horizontal")
         self._update_view()
 
     def _update_statusbar(self):
-        count = len(self.renderer.pages)
+        count = self._page_count
         msg = f"{self.current_book_title} | Page {self.current_index + 1}/{count}" if count else self.tr("no_document")
-        self.statusBar().showMessage(msg)
+        if msg != self._last_status:
+            self.statusBar().showMessage(msg)
+            self._last_status = msg
 
     def _update_zoom_label(self):
         if self.renderer.book_type == "pdf":
-            self.zoom_label.setText(f"{int(self.current_zoom * 100)}%")
+            text = f"{int(self.current_zoom * 100)}%"
         else:
-            self.zoom_label.setText(f"{int(self.current_font_size/self.base_font_size * 100)}%")
+            text = f"{int(self.current_font_size/self.base_font_size * 100)}%"
+        if text != self._last_zoom_text:
+            self.zoom_label.setText(text)
+            self._last_zoom_text = text
 
     def toggle_fullscreen(self):
         if self.isFullScreen(): self.showNormal()
@@ -445,20 +1012,33 @@ class FeReaderWindow(QMainWindow):
         pass
 
     def open_settings_dialog(self):
-        fonts = sorted(set(QFontDatabase().families()))
+        if self._cached_families is None:
+            self._cached_families = sorted(set(QFontDatabase.families()))
+        fonts = self._cached_families
         dlg = SettingsDialog(self, fonts, self.font_family, self.base_font_size, self.theme, self.language)
         if dlg.exec() == QDialog.Accepted:
+            old_theme, old_lang = self.theme, self.language
+            old_font, old_size = self.font_family, self.base_font_size
             v = dlg.get_values()
             self.font_family = v["font_family"]; self.base_font_size = v["font_size"]
             self.theme = v["theme"]; self.language = v["language"]
             self.current_font_size = self.base_font_size
-            self.apply_theme(); self.apply_language(); self.save_settings(); self._update_view()
+            if self.theme != old_theme: self.apply_theme()
+            if self.language != old_lang: self.apply_language()
+            self.save_settings()
+            # Re-render only when the change is visible in the current view:
+            # PDFs are unaffected by font/language edits, EPUBs only by
+            # font or theme changes.
+            font_changed = (self.font_family, self.base_font_size) != (old_font, old_size)
+            if self.renderer.book_type == "epub" and (font_changed or self.theme != old_theme):
+                self._update_view()
 
     def open_convert_dialog(self):
         ConvertDialog(self, self.language).exec()
 
 def main():
     app = QApplication(sys.argv)
+    QPixmapCache.setCacheLimit(100 * 1024)  # 100 MB for rendered pages
     window = FeReaderWindow()
     mode = window.cfg_mgr.get("display_mode", "1")
     if mode == "2": window.showFullScreen()
@@ -41,6 +41,7 @@ class ConfigManager:
     def __init__(self):
         self.config_path = os.path.join(APP_DIR, "settings.ini")
         self.config = configparser.ConfigParser()
+        self._dirty = False
         self._load_or_create_settings()
 
     def _load_or_create_settings(self):
@@ -53,24 +54,32 @@ class ConfigManager:
                 self.config.read(self.config_path, encoding="utf-8")
             except Exception:
                 self.config = configparser.ConfigParser()
-        
+
         if "General" not in self.config:
             self.config["General"] = {}
-        
+
         general = self.config["General"]
         for key, value in defaults.items():
-            general.setdefault(key, value)
+            if key not in general:
+                general[key] = value
+                self._dirty = True
         self.save()
 
     def get(self, key, default=None):
         return self.config["General"].get(key, default)
 
     def set(self, key, value):
-        self.config["General"][key] = str(value)
+        value = str(value)
+        if self.config["General"].get(key) != value:
+            self.config["General"][key] = value
+            self._dirty = True
 
     def save(self):
+        if not self._dirty:
+            return
         with open(self.config_path, "w", encoding="utf-8") as f:
             self.config.write(f)
+        self._dirty = False
 
 class ConverterLogic:
     """Handles the actual file conversion logic separated from UI."""
@@ -103,14 +112,16 @@ class ConverterLogic:
         epub.write_epub(output_path, book)
 
     @staticmethod
-    def images_to_pdf(input_paths, output_path, password=None):
+    def images_to_pdf(input_paths, output_path, password=None, progress_callback=None):
         doc = fitz.open()
-        for img_path in input_paths:
+        for i, img_path in enumerate(input_paths):
             img_doc = fitz.open(img_path)
             rect = img_doc[0].rect
             page = doc.new_page(width=rect.width, height=rect.height)
             page.insert_image(rect, filename=img_path)
             img_doc.close()
+            if progress_callback:
+                progress_callback(i + 1)
         ConverterLogic._save_doc(doc, output_path, password)
 
     @staticmethod
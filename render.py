@@ -1,32 +1,73 @@
-import os
-import shutil
-import tempfile
-import posixpath
-import fitz 
+import collections
+import threading
+from concurrent.futures import ThreadPoolExecutor
+import fitz
 import ebooklib
 from ebooklib import epub
-from bs4 import BeautifulSoup
 from PySide6.QtGui import QImage, QPixmap, QPainter
-from PySide6.QtCore import Qt, QUrl
+from PySide6.QtCore import Qt
+
+try:
+    fitz.TOOLS.mupdf_display_errors(False)
+except Exception:
+    pass
 
 class RenderEngine:
     def __init__(self):
         self.pdf_doc = None
-        self.epub_temp_dir = None
-        self.pages = []  
+        self.epub_items = {}
+        self.pages = []
         self.book_type = None
+        self._pdf_path = None
+        self._pdf_password = None
+        self._pdf_doc_alt = None
+        self._spread_exec = None
+        self._img_cache = collections.OrderedDict()
+        self._img_cache_cap = 8
+        self._img_cache_lock = threading.Lock()
+        # One lock per document handle: MuPDF documents must not be used
+        # from two threads at once, so every render/inspect of a handle
+        # happens under its lock.
+        self._doc_lock = threading.Lock()
+        self._alt_lock = threading.Lock()
+        # Bumped by cleanup(); tasks capture it before rendering and
+        # re-check under a lock before publishing side effects, so work
+        # started against the previous book cannot leak into the next one.
+        self._generation = 0
 
     def cleanup(self):
-        """Clean up temp files and close documents."""
-        if self.epub_temp_dir and os.path.isdir(self.epub_temp_dir):
-            try:
-                shutil.rmtree(self.epub_temp_dir, ignore_errors=True)
-            except Exception:
-                pass
-        self.epub_temp_dir = None
-        if self.pdf_doc:
-            self.pdf_doc.close()
-            self.pdf_doc = None
+        """Drop book state and close documents."""
+        self._generation += 1
+        self.epub_items = {}
+        # Shut the spread executor down before taking _alt_lock: a queued
+        # task needs that lock to run, so shutting down inside it would
+        # deadlock.
+        spread_exec = self._spread_exec
+        self._spread_exec = None
+        if spread_exec:
+            spread_exec.shutdown(wait=True)
+        # Taking the document locks waits out any render still in flight;
+        # renders that start afterwards see a closed/None handle and bail.
+        with self._alt_lock:
+            if self._pdf_doc_alt:
+                self._pdf_doc_alt.close()
+                self._pdf_doc_alt = None
+            # Clear the path under the same lock so _alt_doc cannot reopen
+            # the old file between the close above and here.
+            self._pdf_path = None
+            self._pdf_password = None
+        with self._doc_lock:
+            if self.pdf_doc:
+                self.pdf_doc.close()
+                self.pdf_doc = None
+        with self._img_cache_lock:
+            self._img_cache.clear()
+        # Release MuPDF's internal resource store (glyphs, images, fonts);
+        # on image-heavy PDFs it otherwise keeps growing across books.
+        try:
+            fitz.TOOLS.store_shrink(100)
+        except Exception:
+            pass
 
     def load_pdf(self, path, password_callback=None):
         self.cleanup()
@@ -39,94 +80,177 @@ class RenderEngine:
                 if not pw or not self.pdf_doc.authenticate(pw):
                     self.pdf_doc.close()
                     raise ValueError("Password required or incorrect")
+                self._pdf_password = pw
             else:
                 self.pdf_doc.close()
                 raise ValueError("Password required")
 
+        self._pdf_path = path
         self.pages = list(range(self.pdf_doc.page_count))
         return len(self.pages)
 
     def load_epub(self, path):
         self.cleanup()
         self.book_type = "epub"
-        self.epub_temp_dir = tempfile.mkdtemp(prefix="fereader_epub_")
-        
+
         book = epub.read_epub(path)
-        
-        for item in book.get_items():
-            content = item.get_content()
-            rel_path = item.file_name.replace("/", os.sep)
-            out_path = os.path.join(self.epub_temp_dir, rel_path)
-            os.makedirs(os.path.dirname(out_path), exist_ok=True)
-            with open(out_path, "wb") as f:
-                f.write(content)
-
-        # Process HTML
+
+        # Keep every resource in memory; the view streams them through the
+        # epub:// scheme, so there is no temp-dir extraction and no HTML
+        # rewriting of image paths.
+        self.epub_items = {}
         self.pages = []
-        for item in book.get_items_of_type(ebooklib.ITEM_DOCUMENT):
-            html_bytes = item.get_content()
-            html = html_bytes.decode("utf-8", errors="ignore")
-            html_dir = posixpath.dirname(item.file_name)
-            soup = BeautifulSoup(html, "html.parser")
-
-            for img_tag in soup.find_all("img"):
-                src = img_tag.get("src")
-                if src:
-                    rel = posixpath.normpath(posixpath.join(html_dir, src))
-                    local_path = os.path.join(self.epub_temp_dir, rel.replace("/", os.sep))
-                    file_url = QUrl.fromLocalFile(local_path).toString()
-                    img_tag["src"] = file_url
-            
-            self.pages.append(str(soup))
-        
+        for item in book.get_items():
+            self.epub_items[item.file_name] = item.get_content()
+            if item.get_type() == ebooklib.ITEM_DOCUMENT:
+                self.pages.append(item.file_name)
+
         if not self.pages:
-            self.pages.append("<h3>No readable content found.</h3>")
-        
+            self.epub_items["__empty__.xhtml"] = b"<h3>No readable content found.</h3>"
+            self.pages.append("__empty__.xhtml")
+
         return self.pages
 
-    def get_pdf_page_pixmap(self, index, zoom=1.0):
-        if not self.pdf_doc or not (0 <= index < self.pdf_doc.page_count):
-            return None
+    def _render_page_image(self, doc, index, zoom, lock):
+        with lock:
+            return self._render_page_image_locked(doc, index, zoom)
+
+    def _render_page_image_locked(self, doc, index, zoom):
         try:
-            page = self.pdf_doc.load_page(index)
+            if doc is None or getattr(doc, "is_closed", False):
+                return None
+            if not (0 <= index < doc.page_count):
+                return None
+            page = doc.load_page(index)
             if zoom < 0.1: zoom = 0.1
             mat = fitz.Matrix(zoom, zoom)
-            pix = page.get_pixmap(matrix=mat, alpha=True)
-            img = QImage(pix.samples, pix.width, pix.height, pix.stride, QImage.Format_RGBA8888)
-            return QPixmap.fromImage(img.copy())
+            # No alpha: pages composite over white anyway and RGB888 is 25%
+            # less memory traffic per page.
+            pix = page.get_pixmap(matrix=mat, alpha=False)
+            img = QImage(pix.width, pix.height, QImage.Format_RGB888)
+            if pix.stride == img.bytesPerLine():
+                # One memcpy out of the MuPDF-owned buffer; samples_mv avoids
+                # materializing an intermediate bytes object where available.
+                img.bits()[:] = getattr(pix, "samples_mv", pix.samples)
+                return img
+            # Row paddings differ: let Qt walk the scanlines.
+            img = QImage(pix.samples, pix.width, pix.height, pix.stride, QImage.Format_RGB888)
+            return img.copy()
         except Exception as e:
             print(f"Render Error: {e}")
             return None
 
-    def get_pdf_spread_pixmap(self, left_index, zoom=1.0):
-        """Render two pages side-by-side."""
-        left_pix = self.get_pdf_page_pixmap(left_index, zoom)
-        if left_pix is None:
+    def get_pdf_page_image(self, index, zoom=1.0):
+        """Render one page into a QImage. Safe to call off the GUI thread."""
+        doc = self.pdf_doc
+        if doc is None:
             return None
-        
-        right_pix = None
-        if left_index + 1 < self.pdf_doc.page_count:
-            right_pix = self.get_pdf_page_pixmap(left_index + 1, zoom)
-        
-        if right_pix is None:
-            return left_pix
+        gen = self._generation
+        key = (index, zoom)
+        with self._img_cache_lock:
+            img = self._img_cache.get(key)
+            if img is not None:
+                self._img_cache.move_to_end(key)
+                return img
+        img = self._render_page_image(doc, index, zoom, self._doc_lock)
+        if img is not None:
+            with self._img_cache_lock:
+                # A cleanup may have cleared the cache while we rendered;
+                # caching the old book's page would poison the next one.
+                if gen != self._generation:
+                    return img
+                self._img_cache[key] = img
+                self._img_cache.move_to_end(key)
+                while len(self._img_cache) > self._img_cache_cap:
+                    self._img_cache.popitem(last=False)
+        return img
+
+    def _alt_doc(self, gen):
+        """Second document handle for concurrent rendering; MuPDF documents
+        must not be shared across threads."""
+        with self._alt_lock:
+            if gen != self._generation:
+                return None
+            if self._pdf_doc_alt is None and self._pdf_path:
+                try:
+                    doc = fitz.open(self._pdf_path)
+                    if getattr(doc, "needs_pass", False):
+                        if not (self._pdf_password and doc.authenticate(self._pdf_password)):
+                            doc.close()
+                            return None
+                    self._pdf_doc_alt = doc
+                except Exception:
+                    return None
+            return self._pdf_doc_alt
+
+    def get_pdf_spread_image(self, left_index, zoom=1.0):
+        """Render two pages side-by-side into a QImage, in parallel when possible."""
+        if not self.pdf_doc:
+            return None
+
+        right_future = None
+        has_right = left_index + 1 < len(self.pages)
+        if has_right:
+            alt = self._alt_doc(self._generation)
+            if alt is not None:
+                with self._alt_lock:
+                    if self._spread_exec is None:
+                        self._spread_exec = ThreadPoolExecutor(max_workers=1)
+                    exec_ = self._spread_exec
+                right_future = exec_.submit(
+                    self._render_page_image, alt, left_index + 1, zoom, self._alt_lock)
 
-        target_height = max(left_pix.height(), right_pix.height())
-        left_scaled = left_pix.scaledToHeight(target_height, Qt.SmoothTransformation)
-        right_scaled = right_pix.scaledToHeight(target_height, Qt.SmoothTransformation)
+        left_img = self.get_pdf_page_image(left_index, zoom)
+        if right_future is not None:
+            right_img = right_future.result()
+        elif has_right:
+            right_img = self.get_pdf_page_image(left_index + 1, zoom)
+        else:
+            right_img = None
 
-        spread = QPixmap(left_scaled.width() + right_scaled.width(), target_height)
-        spread.fill(Qt.transparent)
+        if left_img is None:
+            return right_img
+
+        if right_img is None:
+            return left_img
+
+        # Both halves render at the same zoom, so heights usually match and
+        # no CPU rescale is needed at all.
+        target_height = max(left_img.height(), right_img.height())
+        left_scaled = (left_img if left_img.height() == target_height
+                       else left_img.scaledToHeight(target_height, Qt.SmoothTransformation))
+        right_scaled = (right_img if right_img.height() == target_height
+                        else right_img.scaledToHeight(target_height, Qt.SmoothTransformation))
+
+        spread = QImage(left_scaled.width() + right_scaled.width(), target_height, QImage.Format_RGB888)
+        spread.fill(Qt.white)
         painter = QPainter(spread)
-        painter.drawPixmap(0, 0, left_scaled)
-        painter.drawPixmap(left_scaled.width(), 0, right_scaled)
+        painter.drawImage(0, 0, left_scaled)
+        painter.drawImage(left_scaled.width(), 0, right_scaled)
         painter.end()
         return spread
+
+    def get_pdf_page_pixmap(self, index, zoom=1.0):
+        img = self.get_pdf_page_image(index, zoom)
+        return QPixmap.fromImage(img) if img else None
+
+    def get_pdf_spread_pixmap(self, left_index, zoom=1.0):
+        img = self.get_pdf_spread_image(left_index, zoom)
+        return QPixmap.fromImage(img) if img else None
     
+    def get_page_size(self, index):
+        """Unscaled page size in points, for sizing placeholders."""
+        with self._doc_lock:
+            if not self.pdf_doc or not (0 <= index < self.pdf_doc.page_count):
+                return (0, 0)
+            rect = self.pdf_doc.load_page(index).rect
+            return (rect.width, rect.height)
+
     def get_initial_zoom(self, view_width, view_height):
-        if self.pdf_doc and self.pdf_doc.page_count > 0:
-            page = self.pdf_doc.load_page(0)
-            z_h = view_height / page.rect.height
-            z_w = view_width / page.rect.width
-            return round(min(z_h, z_w), 2)
+        with self._doc_lock:
+            if self.pdf_doc and self.pdf_doc.page_count > 0:
+                page = self.pdf_doc.load_page(0)
+                z_h = view_height / page.rect.height
+                z_w = view_width / page.rect.width
+                return round(min(z_h, z_w), 2)
         return 1.0
\ No newline at end of file